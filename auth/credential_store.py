@@ -13,6 +13,8 @@ from typing import Optional, List
 from datetime import datetime
 from google.oauth2.credentials import Credentials
 
+from auth.scopes import intern_scopes
+
 logger = logging.getLogger(__name__)
 
 
@@ -151,7 +153,7 @@ class LocalDirectoryCredentialStore(CredentialStore):
                 token_uri=creds_data.get("token_uri"),
                 client_id=creds_data.get("client_id"),
                 client_secret=creds_data.get("client_secret"),
-                scopes=creds_data.get("scopes"),
+                scopes=intern_scopes(creds_data.get("scopes")),
                 expiry=expiry,
             )
 
@@ -16,6 +16,7 @@ from dataclasses import dataclass
 from fastmcp.server.auth import AccessToken
 from google.oauth2.credentials import Credentials
 from auth.oauth_config import is_external_oauth21_provider
+from auth.scopes import intern_scopes
 
 logger = logging.getLogger(__name__)
 
@@ -357,7 +358,7 @@ class OAuth21SessionStore:
                 "token_uri": token_uri,
                 "client_id": client_id,
                 "client_secret": client_secret,
-                "scopes": scopes or [],
+                "scopes": intern_scopes(scopes) or [],
                 "expiry": normalized_expiry,
                 "session_id": session_id,
                 "mcp_session_id": mcp_session_id,
@@ -6,12 +6,18 @@ Separated from service_decorator.py to avoid circular imports.
 """
 
 import logging
+import sys
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
 # Global variable to store enabled tools (set by main.py)
 _ENABLED_TOOLS = None
 
+# Cached result of get_current_scopes(); reset whenever the enabled tools or
+# read-only mode change so the union is only rebuilt on reconfiguration.
+_CURRENT_SCOPES_CACHE = None
+
 # Individual OAuth Scope Constants
 USERINFO_EMAIL_SCOPE = "https://www.googleapis.com/auth/userinfo.email"
 USERINFO_PROFILE_SCOPE = "https://www.googleapis.com/auth/userinfo.profile"
@@ -84,7 +90,7 @@ SCRIPT_METRICS_SCOPE = "https://www.googleapis.com/auth/script.metrics"
 # Google scope hierarchy: broader scopes that implicitly cover narrower ones.
 # See https://developers.google.com/gmail/api/auth/scopes,
 # https://developers.google.com/drive/api/guides/api-specific-auth, etc.
-SCOPE_HIERARCHY = {
+_SCOPE_HIERARCHY = {
     GMAIL_MODIFY_SCOPE: {
         GMAIL_READONLY_SCOPE,
         GMAIL_SEND_SCOPE,
@@ -104,6 +110,24 @@ SCOPE_HIERARCHY = {
     SCRIPT_PROJECTS_SCOPE: {SCRIPT_PROJECTS_READONLY_SCOPE},
     SCRIPT_DEPLOYMENTS_SCOPE: {SCRIPT_DEPLOYMENTS_READONLY_SCOPE},
 }
+SCOPE_HIERARCHY = MappingProxyType(
+    {broad: frozenset(covered) for broad, covered in _SCOPE_HIERARCHY.items()}
+)
+del _SCOPE_HIERARCHY
+
+
+def _invert_scope_hierarchy(hierarchy):
+    """Map each narrow scope to the frozenset of broader scopes that cover it."""
+    implied_by = {}
+    for broad_scope, covered in hierarchy.items():
+        for narrow_scope in covered:
+            implied_by.setdefault(narrow_scope, set()).add(broad_scope)
+    return {scope: frozenset(broader) for scope, broader in implied_by.items()}
+
+
+# Inverted SCOPE_HIERARCHY so a hierarchy check is one lookup per required
+# scope instead of expanding the whole available set on every call.
+_SCOPE_IMPLIED_BY = _invert_scope_hierarchy(SCOPE_HIERARCHY)
 
 
 def has_required_scopes(available_scopes, required_scopes):
@@ -118,64 +142,67 @@ def has_required_scopes(available_scopes, required_scopes):
     Returns:
         True if all required scopes are satisfied.
     """
-    available = set(available_scopes or [])
-    required = set(required_scopes or [])
-    # Expand available scopes with implied narrower scopes
-    expanded = set(available)
-    for broad_scope, covered in SCOPE_HIERARCHY.items():
-        if broad_scope in available:
-            expanded.update(covered)
-    return all(scope in expanded for scope in required)
+    if isinstance(available_scopes, (set, frozenset)):
+        available = available_scopes
+    else:
+        available = set(available_scopes or [])
+    for scope in required_scopes or []:
+        if scope in available:
+            continue
+        # Not held directly; satisfied only if a broader covering scope is held
+        if available.isdisjoint(_SCOPE_IMPLIED_BY.get(scope, ())):
+            return False
+    return True
 
 
 # Base OAuth scopes required for user identification
-BASE_SCOPES = [USERINFO_EMAIL_SCOPE, USERINFO_PROFILE_SCOPE, OPENID_SCOPE]
+BASE_SCOPES = (USERINFO_EMAIL_SCOPE, USERINFO_PROFILE_SCOPE, OPENID_SCOPE)
 
 # Service-specific scope groups
-DOCS_SCOPES = [
+DOCS_SCOPES = (
     DOCS_READONLY_SCOPE,
     DOCS_WRITE_SCOPE,
     DRIVE_READONLY_SCOPE,
     DRIVE_FILE_SCOPE,
-]
+)
 
-CALENDAR_SCOPES = [CALENDAR_SCOPE, CALENDAR_READONLY_SCOPE, CALENDAR_EVENTS_SCOPE]
+CALENDAR_SCOPES = (CALENDAR_SCOPE, CALENDAR_READONLY_SCOPE, CALENDAR_EVENTS_SCOPE)
 
-DRIVE_SCOPES = [DRIVE_SCOPE, DRIVE_READONLY_SCOPE, DRIVE_FILE_SCOPE]
+DRIVE_SCOPES = (DRIVE_SCOPE, DRIVE_READONLY_SCOPE, DRIVE_FILE_SCOPE)
 
-GMAIL_SCOPES = [
+GMAIL_SCOPES = (
     GMAIL_READONLY_SCOPE,
     GMAIL_SEND_SCOPE,
     GMAIL_COMPOSE_SCOPE,
     GMAIL_MODIFY_SCOPE,
     GMAIL_LABELS_SCOPE,
     GMAIL_SETTINGS_BASIC_SCOPE,
-]
+)
 
-CHAT_SCOPES = [
+CHAT_SCOPES = (
     CHAT_READONLY_SCOPE,
     CHAT_WRITE_SCOPE,
     CHAT_SPACES_SCOPE,
     CHAT_SPACES_READONLY_SCOPE,
-]
+)
 
-SHEETS_SCOPES = [SHEETS_READONLY_SCOPE, SHEETS_WRITE_SCOPE, DRIVE_READONLY_SCOPE]
+SHEETS_SCOPES = (SHEETS_READONLY_SCOPE, SHEETS_WRITE_SCOPE, DRIVE_READONLY_SCOPE)
 
-FORMS_SCOPES = [
+FORMS_SCOPES = (
     FORMS_BODY_SCOPE,
     FORMS_BODY_READONLY_SCOPE,
     FORMS_RESPONSES_READONLY_SCOPE,
-]
+)
 
-SLIDES_SCOPES = [SLIDES_SCOPE, SLIDES_READONLY_SCOPE]
+SLIDES_SCOPES = (SLIDES_SCOPE, SLIDES_READONLY_SCOPE)
 
-TASKS_SCOPES = [TASKS_SCOPE, TASKS_READONLY_SCOPE]
+TASKS_SCOPES = (TASKS_SCOPE, TASKS_READONLY_SCOPE)
 
-CONTACTS_SCOPES = [CONTACTS_SCOPE, CONTACTS_READONLY_SCOPE]
+CONTACTS_SCOPES = (CONTACTS_SCOPE, CONTACTS_READONLY_SCOPE)
 
-CUSTOM_SEARCH_SCOPES = [CUSTOM_SEARCH_SCOPE]
+CUSTOM_SEARCH_SCOPES = (CUSTOM_SEARCH_SCOPE,)
 
-SCRIPT_SCOPES = [
+SCRIPT_SCOPES = (
     SCRIPT_PROJECTS_SCOPE,
     SCRIPT_PROJECTS_READONLY_SCOPE,
     SCRIPT_DEPLOYMENTS_SCOPE,
@@ -183,45 +210,86 @@ SCRIPT_SCOPES = [
     SCRIPT_PROCESSES_READONLY_SCOPE,  # Required for list_script_processes
     SCRIPT_METRICS_SCOPE,  # Required for get_script_metrics
     DRIVE_FILE_SCOPE,  # Required for list/delete script projects (uses Drive API)
-]
+)
 
 # Tool-to-scopes mapping
-TOOL_SCOPES_MAP = {
-    "gmail": GMAIL_SCOPES,
-    "drive": DRIVE_SCOPES,
-    "calendar": CALENDAR_SCOPES,
-    "docs": DOCS_SCOPES,
-    "sheets": SHEETS_SCOPES,
-    "chat": CHAT_SCOPES,
-    "forms": FORMS_SCOPES,
-    "slides": SLIDES_SCOPES,
-    "tasks": TASKS_SCOPES,
-    "contacts": CONTACTS_SCOPES,
-    "search": CUSTOM_SEARCH_SCOPES,
-    "appscript": SCRIPT_SCOPES,
-}
+TOOL_SCOPES_MAP = MappingProxyType(
+    {
+        "gmail": GMAIL_SCOPES,
+        "drive": DRIVE_SCOPES,
+        "calendar": CALENDAR_SCOPES,
+        "docs": DOCS_SCOPES,
+        "sheets": SHEETS_SCOPES,
+        "chat": CHAT_SCOPES,
+        "forms": FORMS_SCOPES,
+        "slides": SLIDES_SCOPES,
+        "tasks": TASKS_SCOPES,
+        "contacts": CONTACTS_SCOPES,
+        "search": CUSTOM_SEARCH_SCOPES,
+        "appscript": SCRIPT_SCOPES,
+    }
+)
 
 # Tool-to-read-only-scopes mapping
-TOOL_READONLY_SCOPES_MAP = {
-    "gmail": [GMAIL_READONLY_SCOPE],
-    "drive": [DRIVE_READONLY_SCOPE],
-    "calendar": [CALENDAR_READONLY_SCOPE],
-    "docs": [DOCS_READONLY_SCOPE, DRIVE_READONLY_SCOPE],
-    "sheets": [SHEETS_READONLY_SCOPE, DRIVE_READONLY_SCOPE],
-    "chat": [CHAT_READONLY_SCOPE, CHAT_SPACES_READONLY_SCOPE],
-    "forms": [FORMS_BODY_READONLY_SCOPE, FORMS_RESPONSES_READONLY_SCOPE],
-    "slides": [SLIDES_READONLY_SCOPE],
-    "tasks": [TASKS_READONLY_SCOPE],
-    "contacts": [CONTACTS_READONLY_SCOPE],
-    "search": CUSTOM_SEARCH_SCOPES,
-    "appscript": [
-        SCRIPT_PROJECTS_READONLY_SCOPE,
-        SCRIPT_DEPLOYMENTS_READONLY_SCOPE,
-        SCRIPT_PROCESSES_READONLY_SCOPE,
-        SCRIPT_METRICS_SCOPE,
-        DRIVE_READONLY_SCOPE,
-    ],
+TOOL_READONLY_SCOPES_MAP = MappingProxyType(
+    {
+        "gmail": (GMAIL_READONLY_SCOPE,),
+        "drive": (DRIVE_READONLY_SCOPE,),
+        "calendar": (CALENDAR_READONLY_SCOPE,),
+        "docs": (DOCS_READONLY_SCOPE, DRIVE_READONLY_SCOPE),
+        "sheets": (SHEETS_READONLY_SCOPE, DRIVE_READONLY_SCOPE),
+        "chat": (CHAT_READONLY_SCOPE, CHAT_SPACES_READONLY_SCOPE),
+        "forms": (FORMS_BODY_READONLY_SCOPE, FORMS_RESPONSES_READONLY_SCOPE),
+        "slides": (SLIDES_READONLY_SCOPE,),
+        "tasks": (TASKS_READONLY_SCOPE,),
+        "contacts": (CONTACTS_READONLY_SCOPE,),
+        "search": CUSTOM_SEARCH_SCOPES,
+        "appscript": (
+            SCRIPT_PROJECTS_READONLY_SCOPE,
+            SCRIPT_DEPLOYMENTS_READONLY_SCOPE,
+            SCRIPT_PROCESSES_READONLY_SCOPE,
+            SCRIPT_METRICS_SCOPE,
+            DRIVE_READONLY_SCOPE,
+        ),
+    }
+)
+
+# Per-tool scope sets, precomputed once so scope resolution is a dict lookup
+# plus a set union instead of rebuilding and deduplicating lists on every call.
+_BASE_SCOPE_SET = frozenset(BASE_SCOPES)
+_TOOL_SCOPE_SETS = {tool: frozenset(scopes) for tool, scopes in TOOL_SCOPES_MAP.items()}
+_TOOL_READONLY_SCOPE_SETS = {
+    tool: frozenset(scopes) for tool, scopes in TOOL_READONLY_SCOPES_MAP.items()
 }
+_ALL_READ_ONLY_SCOPES = _BASE_SCOPE_SET.union(*_TOOL_READONLY_SCOPE_SETS.values())
+
+# Canonical string object for every scope this server knows about
+_KNOWN_SCOPES = {
+    scope: scope
+    for scope in _BASE_SCOPE_SET.union(
+        *_TOOL_SCOPE_SETS.values(), *_TOOL_READONLY_SCOPE_SETS.values()
+    )
+}
+
+
+def intern_scopes(scopes):
+    """
+    Replace each scope string with a shared canonical object.
+
+    Known scopes map to this module's constants and any others are
+    sys.intern()'d, so credentials held for many users and sessions share one
+    copy of each scope string, and lookups against the precomputed scope sets
+    match by identity.
+
+    Args:
+        scopes: Iterable of scope strings, or None.
+
+    Returns:
+        List of canonical scope strings, or None if scopes is None.
+    """
+    if scopes is None:
+        return None
+    return [_KNOWN_SCOPES.get(scope) or sys.intern(scope) for scope in scopes]
 
 
 def set_enabled_tools(enabled_tools):
@@ -231,14 +299,19 @@ def set_enabled_tools(enabled_tools):
     Args:
         enabled_tools: List of enabled tool names.
     """
-    global _ENABLED_TOOLS
+    global _ENABLED_TOOLS, _CURRENT_SCOPES_CACHE
     _ENABLED_TOOLS = enabled_tools
+    _CURRENT_SCOPES_CACHE = None
     logger.info(f"Enabled tools set for scope management: {enabled_tools}")
 
 
 # Global variable to store read-only mode (set by main.py)
 _READ_ONLY_MODE = False
 
+# Membership test for the read-only scope set, bound when read-only mode is
+# enabled and None otherwise (see get_scope_checker()).
+_SCOPE_CHECKER = None
+
 
 def set_read_only(enabled: bool):
     """
@@ -247,8 +320,10 @@ def set_read_only(enabled: bool):
     Args:
         enabled: Boolean indicating if read-only mode should be enabled.
     """
-    global _READ_ONLY_MODE
+    global _READ_ONLY_MODE, _CURRENT_SCOPES_CACHE, _SCOPE_CHECKER
     _READ_ONLY_MODE = enabled
+    _CURRENT_SCOPES_CACHE = None
+    _SCOPE_CHECKER = _ALL_READ_ONLY_SCOPES.__contains__ if enabled else None
     logger.info(f"Read-only mode set to: {enabled}")
 
 
@@ -259,10 +334,21 @@ def is_read_only_mode() -> bool:
 
 def get_all_read_only_scopes() -> list[str]:
     """Get all possible read-only scopes across all tools."""
-    all_scopes = set(BASE_SCOPES)
-    for scopes in TOOL_READONLY_SCOPES_MAP.values():
-        all_scopes.update(scopes)
-    return list(all_scopes)
+    return list(_ALL_READ_ONLY_SCOPES)
+
+
+def get_scope_checker():
+    """
+    Get the membership test for scopes allowed in read-only mode.
+
+    The checker is the bound __contains__ of the frozen read-only scope set, so
+    callers filtering many scopes pay a single C-level lookup per scope.
+
+    Returns:
+        Callable taking a scope string and returning True if it is allowed, or
+        None if read-only mode is disabled and every scope is allowed.
+    """
+    return _SCOPE_CHECKER
 
 
 def get_current_scopes():
@@ -278,7 +364,10 @@ def get_current_scopes():
     Returns:
         List of unique scopes for the enabled tools plus base scopes.
     """
-    return get_scopes_for_tools(_ENABLED_TOOLS)
+    global _CURRENT_SCOPES_CACHE
+    if _CURRENT_SCOPES_CACHE is None:
+        _CURRENT_SCOPES_CACHE = frozenset(get_scopes_for_tools(_ENABLED_TOOLS))
+    return list(_CURRENT_SCOPES_CACHE)
 
 
 def get_scopes_for_tools(enabled_tools=None):
@@ -295,23 +384,19 @@ def get_scopes_for_tools(enabled_tools=None):
         # Default behavior - return all scopes
         enabled_tools = TOOL_SCOPES_MAP.keys()
 
-    # Start with base scopes (always required)
-    scopes = BASE_SCOPES.copy()
-
-    # Determine which map to use based on read-only mode
-    scope_map = TOOL_READONLY_SCOPES_MAP if _READ_ONLY_MODE else TOOL_SCOPES_MAP
+    # Determine which precomputed sets to use based on read-only mode
+    scope_sets = _TOOL_READONLY_SCOPE_SETS if _READ_ONLY_MODE else _TOOL_SCOPE_SETS
     mode_str = "read-only" if _READ_ONLY_MODE else "full"
 
-    # Add scopes for each enabled tool
-    for tool in enabled_tools:
-        if tool in scope_map:
-            scopes.extend(scope_map[tool])
+    # Base scopes are always required; union in each enabled tool's scopes
+    scopes = _BASE_SCOPE_SET.union(
+        *(scope_sets[tool] for tool in enabled_tools if tool in scope_sets)
+    )
 
     logger.debug(
-        f"Generated {mode_str} scopes for tools {list(enabled_tools)}: {len(set(scopes))} unique scopes"
+        f"Generated {mode_str} scopes for tools {list(enabled_tools)}: {len(scopes)} unique scopes"
     )
-    # Return unique scopes
-    return list(set(scopes))
+    return list(scopes)
 
 
 # Combined scopes for all supported Google Workspace operations (backwards compatibility)
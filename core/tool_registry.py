@@ -9,7 +9,7 @@ import logging
 from typing import Set, Optional, Callable
 
 from auth.oauth_config import is_oauth21_enabled
-from auth.scopes import is_read_only_mode, get_all_read_only_scopes
+from auth.scopes import is_read_only_mode, get_scope_checker
 
 logger = logging.getLogger(__name__)
 
@@ -111,7 +111,7 @@ def filter_server_tools(server):
     tool_components = get_tool_components(server)
 
     read_only_mode = is_read_only_mode()
-    allowed_scopes = set(get_all_read_only_scopes()) if read_only_mode else None
+    is_allowed_scope = get_scope_checker()
 
     tools_to_remove = set()
 
@@ -141,7 +141,7 @@ def filter_server_tools(server):
 
             if required_scopes:
                 # If ANY required scope is not in the allowed read-only scopes, disable the tool
-                if not all(scope in allowed_scopes for scope in required_scopes):
+                if not all(map(is_allowed_scope, required_scopes)):
                     logger.info(
                         f"Read-only mode: Disabling tool '{tool_name}' (requires write scopes: {required_scopes})"
                     )
@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 
 TierLevel = Literal["core", "extended", "complete"]
 
+# Tier levels from narrowest to broadest; each tier includes those before it.
+_TIER_ORDER = ("core", "extended", "complete")
+
 
 class ToolTierLoader:
     """Loads and manages tool tiers from configuration."""
@@ -32,6 +35,7 @@ class ToolTierLoader:
 
         self.config_path = Path(config_path)
         self._tiers_config: Optional[Dict] = None
+        self._tool_service_index: Optional[Dict[str, Set[str]]] = None
 
     def _load_config(self) -> Dict:
         """Load the tool tiers configuration from YAML file."""
@@ -109,23 +113,28 @@ class ToolTierLoader:
         Returns:
             List of tool names up to the specified tier level
         """
-        tier_order = ["core", "extended", "complete"]
-        max_tier_index = tier_order.index(tier)
+        max_tier_index = _TIER_ORDER.index(tier)
 
         tools = []
-        for i in range(max_tier_index + 1):
-            current_tier = tier_order[i]
+        for current_tier in _TIER_ORDER[: max_tier_index + 1]:
             tools.extend(self.get_tools_for_tier(current_tier, services))
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_tools = []
-        for tool in tools:
-            if tool not in seen:
-                seen.add(tool)
-                unique_tools.append(tool)
+        return list(dict.fromkeys(tools))
+
+    def _get_tool_service_index(self) -> Dict[str, Set[str]]:
+        """Map each tool name to the services that list it in any tier."""
+        if self._tool_service_index is not None:
+            return self._tool_service_index
 
-        return unique_tools
+        index: Dict[str, Set[str]] = {}
+        for service, service_config in self._load_config().items():
+            for tier_tools in service_config.values():
+                for tool in tier_tools or []:
+                    index.setdefault(tool, set()).add(service)
+
+        self._tool_service_index = index
+        return index
 
     def get_services_for_tools(self, tool_names: List[str]) -> Set[str]:
         """
@@ -137,14 +146,11 @@ class ToolTierLoader:
         Returns:
             Set of service names that provide any of the specified tools
         """
-        config = self._load_config()
+        index = self._get_tool_service_index()
         services = set()
 
-        for service, service_config in config.items():
-            for tier_name, tier_tools in service_config.items():
-                if tier_tools and any(tool in tier_tools for tool in tool_names):
-                    services.add(service)
-                    break
+        for tool in tool_names:
+            services.update(index.get(tool, ()))
 
         return services
 
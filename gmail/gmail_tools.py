@@ -7,21 +7,47 @@ This module provides MCP tools for interacting with the Gmail API.
 import logging
 import asyncio
 import base64
+import binascii
+import functools
+import hashlib
+import io
+import json
 import ssl
+import sys
 import mimetypes
+import threading
+from collections import OrderedDict
 from html.parser import HTMLParser
-from typing import Annotated, Optional, List, Dict, Literal, Any
+from typing import Annotated, Optional, List, Dict, Literal, Any, NamedTuple, Union
 
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
+from email.generator import BytesGenerator
+from email.message import Message
+from email.policy import Compat32, compat32
 from email.utils import formataddr
 
 from pydantic import Field
 
+# orjson parses large base64-heavy attachment payloads much faster than the
+# stdlib; it is optional and the stdlib parser is used when it isn't installed.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# pybase64 is a SIMD-accelerated drop-in for the stdlib base64 functions used
+# on attachment and raw message payloads; it is optional as well.
+try:
+    import pybase64 as _base64
+except ImportError:
+    _base64 = base64
+
 from auth.service_decorator import require_google_service
-from core.utils import handle_http_errors, validate_file_path
+from core.utils import handle_http_errors, validate_file_path, UserInputError
 from core.server import server
 from auth.scopes import (
     GMAIL_SEND_SCOPE,
@@ -36,6 +62,59 @@ GMAIL_BATCH_SIZE = 25
 GMAIL_REQUEST_DELAY = 0.1
 HTML_BODY_TRUNCATE_LIMIT = 20000
 GMAIL_METADATA_HEADERS = ["Subject", "From", "To", "Cc", "Message-ID", "Date"]
+# Headers shown for each message when formatting a thread
+_THREAD_MESSAGE_HEADERS = [
+    "Subject",
+    "From",
+    "Date",
+    "Message-ID",
+    "In-Reply-To",
+    "References",
+]
+GMAIL_ATTACHMENT_SIZE_LIMIT = 25 * 1024 * 1024  # Gmail's 25MB attachment limit
+# Longest base64 string that can decode to an attachment within the limit
+_MAX_ATTACHMENT_BASE64_LEN = (GMAIL_ATTACHMENT_SIZE_LIMIT + 2) // 3 * 4
+# Line breaks and spaces allowed in wrapped base64 input
+_BASE64_WHITESPACE = b" \t\r\n"
+# Maps Gmail's url-safe base64 alphabet onto the standard one used in MIME bodies
+_URLSAFE_TO_STANDARD_BASE64 = bytes.maketrans(b"-_", b"+/")
+_STANDARD_BASE64_ALPHABET = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+)
+# Line length of base64 MIME bodies, matching email.encoders.encode_base64
+_MIME_BASE64_LINE_LENGTH = 76
+# Attachments up to this size have their encoded MIME body kept in a small
+# per-user LRU so the same file attached again by that user is not re-encoded
+_CACHED_ATTACHMENT_MAX_SIZE = 2 * 1024 * 1024
+# Total size of the encoded bodies that LRU may hold
+_ATTACHMENT_BODY_CACHE_BUDGET = 8 * 1024 * 1024
+# Characters stripped from header values to prevent header injection
+_HEADER_UNSAFE_CHARS = str.maketrans("", "", "\r\n\x00")
+
+
+class _RawMessagePolicy(Compat32):
+    """
+    compat32 policy that only folds plain ASCII headers past its line limit.
+
+    Header values that still need RFC 2047 encoding are folded with the
+    default 78-column compat32 policy, so each encoded-word stays within the
+    75 characters RFC 2047 allows.
+    """
+
+    def fold(self, name, value):
+        if isinstance(value, str) and value.isascii():
+            return super().fold(name, value)
+        return compat32.fold(name, value)
+
+    def fold_binary(self, name, value):
+        if isinstance(value, str) and value.isascii():
+            return super().fold_binary(name, value)
+        return compat32.fold_binary(name, value)
+
+
+# Serialization policy for raw messages: only fold ASCII headers past RFC 5322's
+# 998-character line limit instead of rewrapping them at 78 columns
+_RAW_MESSAGE_POLICY = _RawMessagePolicy(max_line_length=998)
 
 
 class _HTMLTextExtractor(HTMLParser):
@@ -108,7 +187,7 @@ def _extract_message_bodies(payload):
 
         if body_data:
             try:
-                decoded_data = base64.urlsafe_b64decode(body_data).decode(
+                decoded_data = _base64.urlsafe_b64decode(body_data).decode(
                     "utf-8", errors="ignore"
                 )
                 if mime_type == "text/plain" and not text_body:
@@ -125,7 +204,7 @@ def _extract_message_bodies(payload):
     # Check the main payload if it has body data directly
     if payload.get("body", {}).get("data"):
         try:
-            decoded_data = base64.urlsafe_b64decode(payload["body"]["data"]).decode(
+            decoded_data = _base64.urlsafe_b64decode(payload["body"]["data"]).decode(
                 "utf-8", errors="ignore"
             )
             mime_type = payload.get("mimeType", "")
@@ -228,6 +307,365 @@ def _extract_headers(payload: dict, header_names: List[str]) -> Dict[str, str]:
     return headers
 
 
+class _ResolvedAttachment(NamedTuple):
+    """
+    An outgoing attachment with its content loaded and metadata settled.
+
+    Either content holds the raw bytes, or it is None and content_base64 holds
+    the body already encoded for a base64 MIME part (see _gmail_base64_to_mime).
+    """
+
+    filename: str
+    mime_type: str
+    content: Optional[bytes]
+    content_base64: Optional[str] = None
+
+
+def _parse_attachments_arg(
+    attachments: Optional[Union[str, List[Dict[str, str]]]],
+) -> Optional[List[Dict[str, str]]]:
+    """
+    Parse the attachments tool argument, which may arrive as a JSON string.
+
+    Args:
+        attachments: List of attachment dicts, a JSON string encoding one, or None
+
+    Returns:
+        List of attachment dicts, or None if no attachments were given
+    """
+    # MCP clients may pass list parameters as JSON strings
+    if not isinstance(attachments, str):
+        return attachments
+    try:
+        parsed = _json_loads(attachments)
+    except json.JSONDecodeError as e:
+        raise UserInputError(f"Invalid JSON format for attachments: {e}")
+    if not isinstance(parsed, list) or not all(isinstance(a, dict) for a in parsed):
+        raise UserInputError("Attachments must be a list of objects")
+    return parsed
+
+
+def _decode_attachment_base64(content_base64: str) -> bytes:
+    """
+    Strictly decode standard base64 attachment content, ignoring line breaks.
+
+    Oversized content is rejected from its length once line breaks are
+    stripped, before allocating the decoded bytes.
+
+    Args:
+        content_base64: Standard (not url-safe) base64 string, optionally wrapped
+
+    Returns:
+        The decoded bytes
+
+    Raises:
+        UserInputError: If the content is not valid base64 or exceeds the 25MB limit
+    """
+    try:
+        data = content_base64.encode("ascii").translate(None, _BASE64_WHITESPACE)
+    except UnicodeEncodeError as e:
+        raise UserInputError(f"Invalid base64 attachment content: {e}") from e
+
+    if len(data) > _MAX_ATTACHMENT_BASE64_LEN:
+        raise UserInputError("Attachment exceeds 25MB limit")
+
+    try:
+        if _base64 is base64 and sys.version_info >= (3, 11):
+            # Validates and decodes in a single C pass
+            return binascii.a2b_base64(data, strict_mode=True)
+        return _base64.b64decode(data, validate=True)
+    except binascii.Error as e:
+        raise UserInputError(f"Invalid base64 attachment content: {e}") from e
+
+
+def _resolve_attachments(
+    attachments: List[Union[Dict[str, str], _ResolvedAttachment]],
+) -> List[_ResolvedAttachment]:
+    """
+    Load outgoing attachment content from file paths or base64 strings.
+
+    Args:
+        attachments: Attachment dicts, each with 'path' (file path) OR 'content' (base64) + 'filename',
+            and an optional 'mime_type'. Already-resolved attachments are passed through.
+
+    Returns:
+        List of resolved attachments. Entries that cannot be loaded are logged and skipped.
+
+    Raises:
+        UserInputError: If inline content is not valid base64, or an attachment
+            exceeds the 25MB limit
+    """
+    resolved = []
+    for attachment in attachments:
+        if isinstance(attachment, _ResolvedAttachment):
+            resolved.append(attachment)
+            continue
+
+        file_path = attachment.get("path")
+        filename = attachment.get("filename")
+        content_base64 = attachment.get("content")
+        mime_type = attachment.get("mime_type")
+
+        try:
+            # If path is provided, read and encode the file
+            if file_path:
+                path_obj = validate_file_path(file_path)
+                if not path_obj.exists():
+                    logger.error(f"File not found: {file_path}")
+                    continue
+
+                if path_obj.stat().st_size > GMAIL_ATTACHMENT_SIZE_LIMIT:
+                    raise UserInputError("Attachment exceeds 25MB limit")
+
+                # Read file content
+                with open(path_obj, "rb") as f:
+                    file_data = f.read()
+
+                # Use provided filename or extract from path
+                if not filename:
+                    filename = path_obj.name
+
+                # Auto-detect MIME type if not provided
+                if not mime_type:
+                    mime_type, _ = mimetypes.guess_type(str(path_obj))
+                    if not mime_type:
+                        mime_type = "application/octet-stream"
+
+            # If content is provided (base64), decode it
+            elif content_base64:
+                if not filename:
+                    logger.warning("Skipping attachment: missing filename")
+                    continue
+
+                file_data = _decode_attachment_base64(content_base64)
+                if len(file_data) > GMAIL_ATTACHMENT_SIZE_LIMIT:
+                    raise UserInputError("Attachment exceeds 25MB limit")
+
+                if not mime_type:
+                    mime_type = "application/octet-stream"
+
+            else:
+                logger.warning("Skipping attachment: missing both path and content")
+                continue
+        except UserInputError as e:
+            # Surface rejected attachments instead of sending without them
+            raise UserInputError(
+                f"Failed to attach {filename or file_path}: {e}"
+            ) from e
+        except Exception as e:
+            logger.error(f"Failed to attach {filename or file_path}: {e}")
+            continue
+
+        resolved.append(
+            _ResolvedAttachment(
+                filename=filename, mime_type=mime_type, content=file_data
+            )
+        )
+    return resolved
+
+
+def _wrap_mime_base64(encoded: bytes) -> str:
+    """
+    Wrap standard base64 into 76-character lines for a MIME body.
+
+    Args:
+        encoded: Unwrapped standard base64 bytes
+
+    Returns:
+        The base64 text with lines separated by newlines
+    """
+    step = _MIME_BASE64_LINE_LENGTH
+    lines = [encoded[i : i + step] for i in range(0, len(encoded), step)]
+    return b"\n".join(lines).decode("ascii")
+
+
+def _gmail_base64_to_mime(data: str) -> str:
+    """
+    Convert Gmail API url-safe base64 data into a base64 MIME body.
+
+    The alphabet is translated, padding restored and lines wrapped, so the data
+    can be spliced into an outgoing part without decoding and re-encoding it.
+
+    Args:
+        data: Url-safe base64 string as returned by the Gmail API
+
+    Returns:
+        Standard base64 wrapped at 76 characters per line
+
+    Raises:
+        ValueError: If the data is not valid url-safe base64
+    """
+    try:
+        encoded = data.encode("ascii").translate(_URLSAFE_TO_STANDARD_BASE64)
+    except UnicodeEncodeError as e:
+        raise ValueError(f"Invalid base64 attachment data: {e}") from e
+    encoded = encoded.rstrip(b"=")
+    if encoded.translate(None, _STANDARD_BASE64_ALPHABET) or len(encoded) % 4 == 1:
+        raise ValueError("Invalid base64 attachment data")
+    encoded += b"=" * (-len(encoded) % 4)
+    return _wrap_mime_base64(encoded)
+
+
+class _AttachmentBodyCache:
+    """
+    LRU of encoded attachment bodies keyed by user and content SHA-256 digest.
+
+    The encoded bodies are retained in process memory between requests, so
+    each entry is only visible to the user who attached the file. Entries are
+    evicted once the cached bodies exceed a total size budget.
+    """
+
+    def __init__(self, budget: int):
+        self._budget = budget
+        self._size = 0
+        self._entries: "OrderedDict[tuple[str, bytes], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[str, bytes]) -> Optional[str]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: tuple[str, bytes], body: str) -> None:
+        if len(body) > self._budget:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self._budget:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_attachment_body_cache = _AttachmentBodyCache(_ATTACHMENT_BODY_CACHE_BUDGET)
+
+
+def _encode_attachment_body(
+    content: bytes, user_google_email: Optional[str] = None
+) -> str:
+    """
+    Encode attachment content as a wrapped base64 MIME body.
+
+    Small attachments go through an LRU keyed on the user and the SHA-256
+    digest of the content, so a file the same user attaches again skips the
+    encode. The cache retains the encoded bodies, up to
+    _ATTACHMENT_BODY_CACHE_BUDGET in total. Larger attachments, and content
+    without a user to scope it to, are always encoded directly.
+
+    Args:
+        content: Raw attachment bytes
+        user_google_email: Optional user the attachment is sent for
+
+    Returns:
+        Standard base64 wrapped at 76 characters per line
+    """
+    if user_google_email is None or len(content) > _CACHED_ATTACHMENT_MAX_SIZE:
+        return _wrap_mime_base64(_base64.b64encode(content))
+
+    key = (user_google_email, hashlib.sha256(content).digest())
+    body = _attachment_body_cache.get(key)
+    if body is None:
+        body = _wrap_mime_base64(_base64.b64encode(content))
+        _attachment_body_cache.put(key, body)
+    return body
+
+
+@functools.lru_cache(maxsize=1024)
+def _content_disposition(filename: str) -> str:
+    """
+    Build the Content-Disposition header value for an attachment filename.
+
+    Cached because the same files are often attached repeatedly, and the
+    encoding output depends only on the filename.
+
+    Args:
+        filename: Sanitized attachment filename
+
+    Returns:
+        The header value, e.g. 'attachment; filename="report.pdf"'
+    """
+    # Use add_header with keyword argument so Python's email
+    # library applies RFC 2231 encoding for non-ASCII filenames
+    # (e.g. filename*=utf-8''Pr%C3%BCfbericht.pdf).  Manual
+    # string formatting would drop non-ASCII characters and cause
+    # Gmail to display "noname".
+    header = Message()
+    header.add_header("Content-Disposition", "attachment", filename=filename)
+    return header["Content-Disposition"]
+
+
+def _build_attachment_part(
+    filename: str,
+    mime_type: str,
+    content: Optional[bytes],
+    content_base64: Optional[str] = None,
+    user_google_email: Optional[str] = None,
+) -> MIMEBase:
+    """
+    Build a base64-encoded MIME attachment part.
+
+    Args:
+        filename: Attachment filename; CR, LF and NUL characters are stripped
+        mime_type: MIME type of the attachment (e.g. application/pdf)
+        content: Raw attachment bytes, or None if content_base64 is given
+        content_base64: Optional body that is already base64 encoded and
+            wrapped for MIME, used as-is instead of encoding content
+        user_google_email: Optional user the message is built for, which scopes
+            the cache of encoded bodies
+
+    Returns:
+        The attachment part, ready to attach to a multipart message
+    """
+    main_type, sub_type = mime_type.split("/", 1)
+    part = MIMEBase(main_type, sub_type)
+    if content_base64 is None:
+        # One encode of the whole payload, rather than the per-57-byte encode
+        # loop that email.encoders.encode_base64 runs
+        content_base64 = _encode_attachment_body(content, user_google_email)
+    part.set_payload(content_base64)
+    part["Content-Transfer-Encoding"] = "base64"
+
+    safe_filename = filename.translate(_HEADER_UNSAFE_CHARS) or "attachment"
+
+    part["Content-Disposition"] = _content_disposition(safe_filename)
+    return part
+
+
+def _encode_raw_message(message: Message) -> str:
+    """
+    Serialize a MIME message and url-safe base64 encode it for the Gmail API.
+
+    Plain ASCII headers are only folded past RFC 5322's line limit, which the
+    Gmail API accepts and which skips most of the generator's header rewrapping
+    work; headers that need RFC 2047 encoding keep the usual 78-column folding.
+    The result is encoded straight from the generator's buffer instead of first
+    copying the whole serialized message into a separate bytes object.
+
+    Args:
+        message: The MIME message to encode
+
+    Returns:
+        The url-safe base64 encoded message
+    """
+    buffer = io.BytesIO()
+    generator = BytesGenerator(buffer, mangle_from_=False, policy=_RAW_MESSAGE_POLICY)
+    generator.flatten(message)
+    with buffer.getbuffer() as view:
+        return _base64.urlsafe_b64encode(view).decode()
+
+
 def _prepare_gmail_message(
     subject: str,
     body: str,
@@ -240,7 +678,8 @@ def _prepare_gmail_message(
     body_format: Literal["plain", "html"] = "plain",
     from_email: Optional[str] = None,
     from_name: Optional[str] = None,
-    attachments: Optional[List[Dict[str, str]]] = None,
+    attachments: Optional[List[Union[Dict[str, str], _ResolvedAttachment]]] = None,
+    user_google_email: Optional[str] = None,
 ) -> tuple[str, Optional[str]]:
     """
     Prepare a Gmail message with threading and attachment support.
@@ -257,7 +696,9 @@ def _prepare_gmail_message(
         body_format: Content type for the email body ('plain' or 'html')
         from_email: Optional sender email address
         from_name: Optional sender display name (e.g., "Peter Hartree")
-        attachments: Optional list of attachments. Each can have 'path' (file path) OR 'content' (base64) + 'filename'
+        attachments: Optional list of attachments. Each can have 'path' (file path) OR 'content' (base64) + 'filename',
+            or be an already-resolved _ResolvedAttachment
+        user_google_email: Optional authenticated user the message is built for
 
     Returns:
         Tuple of (raw_message, thread_id) where raw_message is base64 encoded
@@ -277,76 +718,24 @@ def _prepare_gmail_message(
         message = MIMEMultipart()
         message.attach(MIMEText(body, normalized_format))
 
-        # Process attachments
-        for attachment in attachments:
-            file_path = attachment.get("path")
-            filename = attachment.get("filename")
-            content_base64 = attachment.get("content")
-            mime_type = attachment.get("mime_type")
-
+        for attachment in _resolve_attachments(attachments):
+            filename = attachment.filename
             try:
-                # If path is provided, read and encode the file
-                if file_path:
-                    path_obj = validate_file_path(file_path)
-                    if not path_obj.exists():
-                        logger.error(f"File not found: {file_path}")
-                        continue
-
-                    # Read file content
-                    with open(path_obj, "rb") as f:
-                        file_data = f.read()
-
-                    # Use provided filename or extract from path
-                    if not filename:
-                        filename = path_obj.name
-
-                    # Auto-detect MIME type if not provided
-                    if not mime_type:
-                        mime_type, _ = mimetypes.guess_type(str(path_obj))
-                        if not mime_type:
-                            mime_type = "application/octet-stream"
-
-                # If content is provided (base64), decode it
-                elif content_base64:
-                    if not filename:
-                        logger.warning("Skipping attachment: missing filename")
-                        continue
-
-                    file_data = base64.b64decode(content_base64)
-
-                    if not mime_type:
-                        mime_type = "application/octet-stream"
-
-                else:
-                    logger.warning("Skipping attachment: missing both path and content")
-                    continue
-
-                # Create MIME attachment
-                main_type, sub_type = mime_type.split("/", 1)
-                part = MIMEBase(main_type, sub_type)
-                part.set_payload(file_data)
-                encoders.encode_base64(part)
-
-                # Use add_header with keyword argument so Python's email
-                # library applies RFC 2231 encoding for non-ASCII filenames
-                # (e.g. filename*=utf-8''Pr%C3%BCfbericht.pdf).  Manual
-                # string formatting would drop non-ASCII characters and cause
-                # Gmail to display "noname".
-                safe_filename = (
-                    (filename or "attachment")
-                    .replace("\r", "")
-                    .replace("\n", "")
-                    .replace("\x00", "")
-                ) or "attachment"
-
-                part.add_header(
-                    "Content-Disposition", "attachment", filename=safe_filename
+                part = _build_attachment_part(
+                    attachment.filename,
+                    attachment.mime_type,
+                    attachment.content,
+                    content_base64=attachment.content_base64,
+                    user_google_email=user_google_email,
                 )
-
                 message.attach(part)
-                logger.info(f"Attached file: {filename} ({len(file_data)} bytes)")
+                if attachment.content is not None:
+                    size = f"{len(attachment.content)} bytes"
+                else:
+                    size = "pre-encoded"
+                logger.info(f"Attached file: {filename} ({size})")
             except Exception as e:
-                logger.error(f"Failed to attach {filename or file_path}: {e}")
+                logger.error(f"Failed to attach {filename}: {e}")
                 continue
     else:
         message = MIMEText(body, normalized_format)
@@ -357,9 +746,7 @@ def _prepare_gmail_message(
     if from_email:
         if from_name:
             # Sanitize from_name to prevent header injection
-            safe_name = (
-                from_name.replace("\r", "").replace("\n", "").replace("\x00", "")
-            )
+            safe_name = from_name.translate(_HEADER_UNSAFE_CHARS)
             message["From"] = formataddr((safe_name, from_email))
         else:
             message["From"] = from_email
@@ -380,7 +767,7 @@ def _prepare_gmail_message(
         message["References"] = references
 
     # Encode message
-    raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    raw_message = _encode_raw_message(message)
 
     return raw_message, thread_id
 
@@ -1068,9 +1455,9 @@ async def send_gmail_message(
         ),
     ] = None,
     attachments: Annotated[
-        Optional[List[Dict[str, str]]],
+        Optional[Union[str, List[Dict[str, str]]]],
         Field(
-            description='Optional list of attachments. Each can have: "path" (file path, auto-encodes), OR "content" (standard base64, not urlsafe) + "filename". Optional "mime_type". Example: [{"path": "/path/to/file.pdf"}] or [{"filename": "doc.pdf", "content": "base64data", "mime_type": "application/pdf"}]',
+            description='Optional list of attachments (or a JSON string encoding one). Each can have: "path" (file path, auto-encodes), OR "content" (standard base64, not urlsafe) + "filename". Optional "mime_type". Example: [{"path": "/path/to/file.pdf"}] or [{"filename": "doc.pdf", "content": "base64data", "mime_type": "application/pdf"}]',
         ),
     ] = None,
 ) -> str:
@@ -1083,7 +1470,7 @@ async def send_gmail_message(
         subject (str): Email subject.
         body (str): Email body content.
         body_format (Literal['plain', 'html']): Email body format. Defaults to 'plain'.
-        attachments (Optional[List[Dict[str, str]]]): Optional list of attachments. Each dict can contain:
+        attachments (Optional[Union[str, List[Dict[str, str]]]]): Optional list of attachments, or a JSON string encoding one. Each dict can contain:
             Option 1 - File path (auto-encodes):
               - 'path' (required): File path to attach
               - 'filename' (optional): Override filename
@@ -1170,6 +1557,7 @@ async def send_gmail_message(
             references="<original@gmail.com> <message123@gmail.com>"
         )
     """
+    attachments = _parse_attachments_arg(attachments)
     logger.info(
         f"[send_gmail_message] Invoked. Email: '{user_google_email}', Subject: '{subject}', Attachments: {len(attachments) if attachments else 0}"
     )
@@ -1190,6 +1578,7 @@ async def send_gmail_message(
         from_email=sender_email,
         from_name=from_name,
         attachments=attachments if attachments else None,
+        user_google_email=user_google_email,
     )
 
     send_body = {"raw": raw_message}
@@ -1266,9 +1655,9 @@ async def draft_gmail_message(
         ),
     ] = None,
     attachments: Annotated[
-        Optional[List[Dict[str, str]]],
+        Optional[Union[str, List[Dict[str, str]]]],
         Field(
-            description="Optional list of attachments. Each can have: 'path' (file path, auto-encodes), OR 'content' (standard base64, not urlsafe) + 'filename'. Optional 'mime_type' (auto-detected from path if not provided).",
+            description="Optional list of attachments (or a JSON string encoding one). Each can have: 'path' (file path, auto-encodes), OR 'content' (standard base64, not urlsafe) + 'filename'. Optional 'mime_type' (auto-detected from path if not provided).",
         ),
     ] = None,
 ) -> str:
@@ -1291,7 +1680,7 @@ async def draft_gmail_message(
         thread_id (Optional[str]): Optional Gmail thread ID to reply within. When provided, creates a reply draft.
         in_reply_to (Optional[str]): Optional Message-ID of the message being replied to. Used for proper threading.
         references (Optional[str]): Optional chain of Message-IDs for proper threading. Should include all previous Message-IDs.
-        attachments (List[Dict[str, str]]): Optional list of attachments. Each dict can contain:
+        attachments (Optional[Union[str, List[Dict[str, str]]]]): Optional list of attachments, or a JSON string encoding one. Each dict can contain:
             Option 1 - File path (auto-encodes):
               - 'path' (required): File path to attach
               - 'filename' (optional): Override filename
@@ -1356,6 +1745,7 @@ async def draft_gmail_message(
             references="<original@gmail.com> <message123@gmail.com>"
         )
     """
+    attachments = _parse_attachments_arg(attachments)
     logger.info(
         f"[draft_gmail_message] Invoked. Email: '{user_google_email}', Subject: '{subject}'"
     )
@@ -1376,6 +1766,7 @@ async def draft_gmail_message(
         from_email=sender_email,
         from_name=from_name,
         attachments=attachments,
+        user_google_email=user_google_email,
     )
 
     # Create a draft instead of sending
@@ -1409,13 +1800,12 @@ def _format_thread_content(thread_data: dict, thread_id: str) -> str:
     if not messages:
         return f"No messages found in thread '{thread_id}'."
 
-    # Extract thread subject from the first message
-    first_message = messages[0]
-    first_headers = {
-        h["name"]: h["value"]
-        for h in first_message.get("payload", {}).get("headers", [])
-    }
-    thread_subject = first_headers.get("Subject", "(no subject)")
+    # Parse each message's headers once; the thread subject is the first one's
+    message_headers = [
+        _extract_headers(message.get("payload", {}), _THREAD_MESSAGE_HEADERS)
+        for message in messages
+    ]
+    thread_subject = message_headers[0].get("Subject", "(no subject)")
 
     # Build the thread content
     content_lines = [
@@ -1426,12 +1816,7 @@ def _format_thread_content(thread_data: dict, thread_id: str) -> str:
     ]
 
     # Process each message in the thread
-    for i, message in enumerate(messages, 1):
-        # Extract headers
-        headers = {
-            h["name"]: h["value"] for h in message.get("payload", {}).get("headers", [])
-        }
-
+    for i, (message, headers) in enumerate(zip(messages, message_headers), 1):
         sender = headers.get("From", "(unknown sender)")
         date = headers.get("Date", "(unknown date)")
         subject = headers.get("Subject", "(no subject)")
@@ -2008,6 +2393,81 @@ async def batch_modify_gmail_message_labels(
     return f"Labels updated for {len(message_ids)} messages: {'; '.join(actions)}"
 
 
+async def _download_forward_attachments(
+    service, message_id: str, orig_attachments: List[Dict[str, Any]]
+) -> List[_ResolvedAttachment]:
+    """
+    Download and decode the attachments of a message being forwarded.
+
+    A single attachment is fetched with one request; several are fetched through
+    the Gmail batch API in one round trip per GMAIL_BATCH_SIZE attachments, with
+    any not returned by a failed batch fetched sequentially instead.
+
+    Args:
+        service: Authenticated Gmail API service
+        message_id: ID of the message the attachments belong to
+        orig_attachments: Attachment metadata from _extract_attachments
+
+    Returns:
+        List of resolved attachments, skipping any whose data cannot be decoded
+    """
+
+    def _attachment_request(att: Dict[str, Any]):
+        return (
+            service.users()
+            .messages()
+            .attachments()
+            .get(userId="me", messageId=message_id, id=att["attachmentId"])
+        )
+
+    results: Dict[str, Dict] = {}
+
+    def _batch_callback(request_id, response, exception):
+        """Callback for batch requests"""
+        results[request_id] = {"data": response, "error": exception}
+
+    if len(orig_attachments) > 1:
+        try:
+            for chunk_start in range(0, len(orig_attachments), GMAIL_BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=_batch_callback)
+                chunk = orig_attachments[chunk_start : chunk_start + GMAIL_BATCH_SIZE]
+                for index, att in enumerate(chunk, start=chunk_start):
+                    batch.add(_attachment_request(att), request_id=str(index))
+                await asyncio.to_thread(batch.execute)
+        except Exception as batch_error:
+            logger.warning(
+                f"[forward_gmail_message] Batch attachment download failed, falling back to sequential requests: {batch_error}"
+            )
+
+    resolved = []
+    for index, att in enumerate(orig_attachments):
+        result = results.get(str(index))
+        if result is None:
+            attachment_data = await asyncio.to_thread(_attachment_request(att).execute)
+        elif result["error"] is not None:
+            raise result["error"]
+        else:
+            attachment_data = result["data"]
+
+        raw_data = attachment_data.get("data", "")
+        # Gmail API returns url-safe base64; convert it to a MIME base64 body
+        # so the outgoing part reuses it without a decode/re-encode round trip
+        try:
+            content_base64 = _gmail_base64_to_mime(raw_data)
+        except ValueError as e:
+            logger.error(f"Failed to attach {att['filename']}: {e}")
+            continue
+        resolved.append(
+            _ResolvedAttachment(
+                filename=att["filename"],
+                mime_type=att["mimeType"],
+                content=None,
+                content_base64=content_base64,
+            )
+        )
+    return resolved
+
+
 async def _forward_gmail_message_impl(
     service,
     user_google_email: str,
@@ -2067,30 +2527,9 @@ async def _forward_gmail_message_impl(
     if include_attachments:
         orig_attachments = _extract_attachments(payload)
         if orig_attachments:
-            att_list = []
-            for att in orig_attachments:
-                attachment_data = await asyncio.to_thread(
-                    service.users()
-                    .messages()
-                    .attachments()
-                    .get(
-                        userId="me",
-                        messageId=message_id,
-                        id=att["attachmentId"],
-                    )
-                    .execute
-                )
-                raw_data = attachment_data.get("data", "")
-                # Gmail API returns url-safe base64; convert to standard
-                content_b64 = raw_data.replace("-", "+").replace("_", "/")
-                att_list.append(
-                    {
-                        "filename": att["filename"],
-                        "mime_type": att["mimeType"],
-                        "content": content_b64,
-                    }
-                )
-            resolved_attachments = att_list
+            resolved_attachments = await _download_forward_attachments(
+                service, message_id, orig_attachments
+            )
 
     # Prepare and send
     sender_email = from_email or user_google_email
@@ -2104,6 +2543,7 @@ async def _forward_gmail_message_impl(
         from_email=sender_email,
         from_name=from_name,
         attachments=resolved_attachments,
+        user_google_email=user_google_email,
     )
 
     send_body = {"raw": raw_message}
@@ -1,12 +1,8 @@
 """Tests for core comments module."""
 
-import sys
-import os
 import pytest
 from unittest.mock import Mock
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-
 from core.comments import _read_comments_impl
 
 
@@ -6,10 +6,6 @@ Tests all Apps Script tools with mocked API responses
 
 import pytest
 from unittest.mock import Mock
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 # Import the internal implementation functions (not the decorated ones)
 from gappsscript.apps_script_tools import (
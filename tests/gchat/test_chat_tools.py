@@ -5,10 +5,6 @@ Unit tests for Google Chat MCP tools — attachment support
 import base64
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 
 def _make_message(text="Hello", attachments=None, msg_name="spaces/S/messages/M"):
@@ -4,11 +4,6 @@ Unit tests for Google Contacts (People API) tools.
 Tests helper functions and formatting utilities.
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-
 from gcontacts.contacts_tools import (
     _format_contact,
     _build_person_body,
@@ -1,10 +1,5 @@
 """Tests for the Google Docs to Markdown converter."""
 
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-
 from gdocs.docs_markdown import (
     convert_doc_to_markdown,
     format_comments_appendix,
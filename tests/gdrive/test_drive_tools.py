@@ -6,10 +6,6 @@ Tests create_drive_folder with mocked API responses.
 
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 
 @pytest.mark.asyncio
@@ -2,15 +2,11 @@
 Unit tests for Drive SSRF protections and DNS pinning helpers.
 """
 
-import os
 import socket
-import sys
 
 import httpx
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-
 from gdrive import drive_tools
 
 
@@ -6,10 +6,6 @@ Tests the batch_update_form tool with mocked API responses
 
 import pytest
 from unittest.mock import Mock
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 # Import the internal implementation function (not the decorated one)
 from gforms.forms_tools import _batch_update_form_impl
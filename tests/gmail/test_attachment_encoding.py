@@ -0,0 +1,219 @@
+"""
+Unit tests for attachment and raw message encoding in gmail_tools.
+"""
+
+import base64
+import binascii
+import email
+import pytest
+from email.header import decode_header, make_header
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import gmail.gmail_tools as gmail_tools
+from gmail.gmail_tools import (
+    _AttachmentBodyCache,
+    _attachment_body_cache,
+    _encode_attachment_body,
+    _encode_raw_message,
+    _gmail_base64_to_mime,
+    _prepare_gmail_message,
+)
+
+_CONTENT = b"fake pdf content"
+_CONTENT_B64 = base64.b64encode(_CONTENT).decode()
+
+# Equal-length payloads, 3-byte aligned so one encode can be split per payload
+_MULTI_CONTENTS = [f"content-{i}".encode() for i in range(3)]
+
+
+def _encode_aligned_payloads(payloads: list[bytes]) -> list[str]:
+    """Base64 encode equal-length, 3-byte-aligned payloads in a single call."""
+    size = len(payloads[0])
+    assert size % 3 == 0 and all(len(p) == size for p in payloads)
+    encoded = binascii.b2a_base64(b"".join(payloads), newline=False).decode("ascii")
+    step = size // 3 * 4
+    return [encoded[i : i + step] for i in range(0, len(encoded), step)]
+
+
+def _attachment_part(filename: str) -> email.message.Message:
+    """Build a message with one base64 attachment and return its parsed MIME part."""
+    raw, _ = _prepare_gmail_message(
+        subject="Test",
+        body="See attached.",
+        attachments=[
+            {
+                "filename": filename,
+                "content": _CONTENT_B64,
+                "mime_type": "application/pdf",
+            }
+        ],
+    )
+    message = email.message_from_bytes(base64.urlsafe_b64decode(raw))
+    assert message["Bcc"] is None
+    body_part, attachment = message.get_payload()
+    return attachment
+
+
+@pytest.mark.parametrize(
+    "filename, expected_filename, expected_substrings",
+    [
+        # Plain ASCII names keep the simple quoted form
+        ("report.pdf", "report.pdf", ['filename="report.pdf"']),
+        # Non-ASCII names use RFC 2231 so Gmail doesn't show "noname"
+        (
+            "Prüfbericht.pdf",
+            "Prüfbericht.pdf",
+            ["filename*=utf-8''Pr%C3%BCfbericht.pdf"],
+        ),
+        (
+            "Überprüfung_März.pdf",
+            "Überprüfung_März.pdf",
+            ["filename*=utf-8''%C3%9Cberpr%C3%BCfung_M%C3%A4rz.pdf"],
+        ),
+        # CR/LF are stripped so the filename can't inject headers
+        (
+            "evil\r\nBcc: victim@example.com.pdf",
+            "evilBcc: victim@example.com.pdf",
+            ['filename="evilBcc: victim@example.com.pdf"'],
+        ),
+        # Special ASCII characters still round-trip through quoting
+        (
+            "my report (final).pdf",
+            "my report (final).pdf",
+            ['filename="my report (final).pdf"'],
+        ),
+    ],
+)
+def test_attachment_filename_encoding(filename, expected_filename, expected_substrings):
+    part = _attachment_part(filename)
+
+    disposition = " ".join(part["Content-Disposition"].split())
+    assert disposition.startswith("attachment;")
+    for expected in expected_substrings:
+        assert expected in disposition
+    assert part.get_filename() == expected_filename
+    assert part.get_content_type() == "application/pdf"
+    assert part.get_payload(decode=True) == _CONTENT
+
+
+def test_prepare_message_with_multiple_attachments():
+    attachments = [
+        {"filename": f"file{i}.txt", "content": content_b64, "mime_type": "text/plain"}
+        for i, content_b64 in enumerate(_encode_aligned_payloads(_MULTI_CONTENTS))
+    ]
+
+    raw, _ = _prepare_gmail_message(
+        subject="Test", body="Three files.", attachments=attachments
+    )
+    message = email.message_from_bytes(base64.urlsafe_b64decode(raw))
+    parts = message.get_payload()[1:]
+
+    assert [part.get_filename() for part in parts] == [
+        "file0.txt",
+        "file1.txt",
+        "file2.txt",
+    ]
+    assert [part.get_payload(decode=True) for part in parts] == _MULTI_CONTENTS
+
+
+def test_encode_raw_message_does_not_fold_headers():
+    subject = "Quarterly report for the regional sales team, " * 3
+    message = MIMEMultipart()
+    message["Subject"] = subject
+    message.attach(MIMEText("See attached.", "plain"))
+
+    raw_bytes = base64.urlsafe_b64decode(_encode_raw_message(message))
+    assert f"Subject: {subject}\n".encode() in raw_bytes
+    assert email.message_from_bytes(raw_bytes)["Subject"] == subject
+
+
+def test_encode_raw_message_folds_encoded_headers():
+    """Headers needing RFC 2047 encoding keep 78-column encoded-word folding."""
+    subject = "Überprüfung der Quartalsberichte für März und April " * 4
+    raw, _ = _prepare_gmail_message(
+        subject=subject,
+        body="See attached.",
+        from_email="juergen@example.com",
+        from_name="Jürgen Müller",
+    )
+
+    raw_bytes = base64.urlsafe_b64decode(raw)
+    headers = raw_bytes.split(b"\n\n", 1)[0]
+    assert all(len(line) <= 78 for line in headers.split(b"\n"))
+
+    message = email.message_from_bytes(raw_bytes)
+    assert str(make_header(decode_header(message["Subject"]))) == subject
+    assert str(make_header(decode_header(message["From"]))) == (
+        "Jürgen Müller <juergen@example.com>"
+    )
+
+
+@pytest.mark.parametrize("payload", [b"", b"a", b"ab", bytes(range(256)) * 3])
+def test_gmail_base64_to_mime_round_trips(payload):
+    # Gmail may omit padding, so strip it to cover restoring it
+    gmail_data = base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    body = _gmail_base64_to_mime(gmail_data)
+    assert all(len(line) <= 76 for line in body.splitlines())
+    assert base64.b64decode(body) == payload
+
+
+@pytest.mark.parametrize("data", ["abcde", "ab*d", "Prüf"])
+def test_gmail_base64_to_mime_rejects_invalid_data(data):
+    with pytest.raises(ValueError):
+        _gmail_base64_to_mime(data)
+
+
+def test_repeated_attachment_body_is_cached():
+    _attachment_body_cache.clear()
+    first = _encode_attachment_body(b"same policy pdf", "user@example.com")
+    second = _encode_attachment_body(b"same policy pdf", "user@example.com")
+
+    assert second is first
+    assert base64.b64decode(first) == b"same policy pdf"
+    assert len(_attachment_body_cache) == 1
+
+
+def test_attachment_body_cache_is_scoped_per_user():
+    _attachment_body_cache.clear()
+    first = _encode_attachment_body(b"same policy pdf", "alice@example.com")
+    second = _encode_attachment_body(b"same policy pdf", "bob@example.com")
+
+    assert second is not first
+    assert second == first
+    assert len(_attachment_body_cache) == 2
+
+
+def test_attachment_body_without_user_bypasses_cache():
+    _attachment_body_cache.clear()
+
+    assert base64.b64decode(_encode_attachment_body(b"12345")) == b"12345"
+    assert len(_attachment_body_cache) == 0
+
+
+def test_large_attachment_body_bypasses_cache(monkeypatch):
+    monkeypatch.setattr(gmail_tools, "_CACHED_ATTACHMENT_MAX_SIZE", 4)
+    _attachment_body_cache.clear()
+
+    body = _encode_attachment_body(b"12345", "user@example.com")
+    assert base64.b64decode(body) == b"12345"
+    assert len(_attachment_body_cache) == 0
+
+
+def test_attachment_body_cache_evicts_past_budget():
+    cache = _AttachmentBodyCache(budget=10)
+    a, b, c, d = (("user@example.com", digest) for digest in (b"a", b"b", b"c", b"d"))
+    cache.put(a, "12345")
+    cache.put(b, "12345")
+    assert cache.get(a) == "12345"
+
+    # Exceeding the budget evicts the least recently used entry
+    cache.put(c, "12345")
+    assert cache.get(b) is None
+    assert cache.get(a) == "12345"
+    assert cache.get(c) == "12345"
+
+    # Bodies larger than the whole budget are never cached
+    cache.put(d, "x" * 11)
+    assert cache.get(d) is None
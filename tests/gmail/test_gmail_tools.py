@@ -2,27 +2,115 @@
 Unit tests for the forward_gmail_message tool.
 """
 
-import base64
+import binascii
 import email
+import functools
 import pytest
-from unittest.mock import Mock, MagicMock
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+import re
+from unittest.mock import Mock
 
 from gmail.gmail_tools import _forward_gmail_message_impl
 
+# All tests in this module share one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Translation tables between the url-safe and standard base64 alphabets
+_URLSAFE_TRANS = bytes.maketrans(b"-_", b"+/")
+_STANDARD_TRANS = bytes.maketrans(b"+/", b"-_")
+
+
+def _make_attachment_b64(content: bytes) -> str:
+    """Helper to url-safe base64 encode bytes the way the Gmail API returns them."""
+    encoded = binascii.b2a_base64(content, newline=False)
+    return encoded.translate(_STANDARD_TRANS).decode("ascii")
+
 
 def _decode_raw_message(raw_b64: str) -> email.message.Message:
     """Helper to decode a base64-encoded raw MIME message."""
-    raw_bytes = base64.urlsafe_b64decode(raw_b64)
+    raw_bytes = binascii.a2b_base64(raw_b64.encode("ascii").translate(_URLSAFE_TRANS))
     return email.message_from_bytes(raw_bytes)
 
 
+_SUBJECT_RE = re.compile(rb"^Subject: (.*?)\r?$", re.MULTILINE)
+
+
+def _subject_of_raw(raw_b64: str) -> str:
+    """Helper to read the Subject header of a raw message without MIME parsing."""
+    raw_bytes = binascii.a2b_base64(raw_b64.encode("ascii").translate(_URLSAFE_TRANS))
+    return _SUBJECT_RE.search(raw_bytes).group(1).decode()
+
+
+class _FakeAttachments:
+    """Stand-in for users().messages().attachments()."""
+
+    def __init__(self):
+        self.get = Mock()
+
+
+class _FakeMessages:
+    """Stand-in for users().messages(); request builders are Mock leaves."""
+
+    def __init__(self):
+        self.get = Mock()
+        self.send = Mock()
+        self._attachments = _FakeAttachments()
+
+    def attachments(self):
+        return self._attachments
+
+
+class _FakeBatch:
+    """Stand-in for BatchHttpRequest that executes each added request in order."""
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self._requests:
+            self._callback(request_id, request.execute(), None)
+
+
+class _FakeGmailService:
+    """Plain Gmail client stand-in so chained resource lookups stay cheap."""
+
+    def __init__(self):
+        self._messages = _FakeMessages()
+        self.new_batch_http_request = Mock(side_effect=_FakeBatch)
+        # Pre-wired execute() leaves, so tests set responses without calling
+        # (and recording calls on) the request builders themselves
+        self.get_message = self._messages.get.return_value.execute
+        self.send_message = self._messages.send.return_value.execute
+        self.get_attachment = self._messages.attachments().get.return_value.execute
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self._messages
+
+
+class _SendRecorder:
+    """Stand-in for messages().send that records calls and returns a fixed result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return self
+
+    def execute(self):
+        return self.result
+
+
 def _make_mock_service():
-    """Create a mock Gmail service with properly chained methods."""
-    return MagicMock()
+    """Create a fake Gmail service with properly chained methods."""
+    return _FakeGmailService()
 
 
 def _make_original_message(
@@ -41,7 +129,7 @@ def _make_original_message(
         {"name": "Date", "value": date},
         {"name": "Message-ID", "value": "<original@example.com>"},
     ]
-    body_b64 = base64.urlsafe_b64encode(body_text.encode()).decode()
+    body_b64 = _make_attachment_b64(body_text.encode())
 
     parts = [
         {
@@ -73,45 +161,74 @@ def _make_original_message(
     }
 
 
-class TestForwardGmailMessageImpl:
+# Shared copies of scalar-argument originals; the forward path only reads them
+_cached_original_message = functools.lru_cache(maxsize=None)(_make_original_message)
+
+# Fixtures built once at import time; tests only read them
+_PDF_CONTENT = b"pdf content here"
+_PDF_CONTENT_B64 = _make_attachment_b64(_PDF_CONTENT)
+_ORIGINAL_WITH_PDF = _make_original_message(
+    attachments=[
+        {
+            "filename": "report.pdf",
+            "mimeType": "application/pdf",
+            "attachmentId": "att_id_1",
+            "size": 1024,
+        }
+    ]
+)
+
+_TEXT_CONTENTS = {"att_a": b"first attachment", "att_b": b"second attachment"}
+_TEXT_CONTENTS_B64 = {
+    att_id: _make_attachment_b64(content) for att_id, content in _TEXT_CONTENTS.items()
+}
+_ORIGINAL_WITH_TEXT_FILES = _make_original_message(
+    attachments=[
+        {"filename": "a.txt", "mimeType": "text/plain", "attachmentId": "att_a"},
+        {"filename": "b.txt", "mimeType": "text/plain", "attachmentId": "att_b"},
+    ]
+)
+
 
-    @pytest.mark.asyncio
-    async def test_forward_basic(self):
-        """Fetches original, sends with 'Fwd:' subject, includes original content."""
+class TestForwardGmailMessageImpl:
+    @pytest.mark.parametrize(
+        "original_kwargs, forward_kwargs, sent_id",
+        [
+            # Fetches original, sends with 'Fwd:' subject, includes original content
+            ({}, {"body": "FYI"}, "fwd123"),
+            # Forwarding a message with no attachments works cleanly
+            ({}, {"include_attachments": True}, "fwd_clean"),
+            # Forwarding with no user body prepended
+            ({"body_text": "Original content"}, {"body": ""}, "fwd_nobody"),
+        ],
+        ids=["basic", "no_original_attachments", "empty_body"],
+    )
+    async def test_forward_sends_message(
+        self, original_kwargs, forward_kwargs, sent_id
+    ):
+        """Forwarding succeeds and reports the sent message ID."""
         service = _make_mock_service()
-        service.users().messages().get().execute.return_value = _make_original_message()
-        service.users().messages().send().execute.return_value = {"id": "fwd123"}
+        service.get_message.return_value = _cached_original_message(**original_kwargs)
+        service.send_message.return_value = {"id": sent_id}
 
         result = await _forward_gmail_message_impl(
             service=service,
             user_google_email="me@example.com",
             message_id="orig_msg_id",
             to="recipient@example.com",
-            body="FYI",
+            **forward_kwargs,
         )
-        assert "fwd123" in result
+        assert sent_id in result
 
-    @pytest.mark.asyncio
     async def test_forward_with_attachments(self):
         """Downloads and includes original attachments."""
         service = _make_mock_service()
-        orig_msg = _make_original_message(
-            attachments=[
-                {
-                    "filename": "report.pdf",
-                    "mimeType": "application/pdf",
-                    "attachmentId": "att_id_1",
-                    "size": 1024,
-                }
-            ]
-        )
-        service.users().messages().get().execute.return_value = orig_msg
-        raw_b64 = base64.urlsafe_b64encode(b"pdf content here").decode()
-        service.users().messages().attachments().get().execute.return_value = {
-            "data": raw_b64,
-            "size": 16,
+        service.get_message.return_value = _ORIGINAL_WITH_PDF
+        service.get_attachment.return_value = {
+            "data": _PDF_CONTENT_B64,
+            "size": len(_PDF_CONTENT),
         }
-        service.users().messages().send().execute.return_value = {"id": "fwd_att123"}
+        service.send_message.return_value = {"id": "fwd_att123"}
 
         result = await _forward_gmail_message_impl(
             service=service,
@@ -122,22 +239,51 @@ class TestForwardGmailMessageImpl:
         )
         assert "fwd_att123" in result
 
-    @pytest.mark.asyncio
+        sent_raw = service.users().messages().send.call_args.kwargs["body"]["raw"]
+        attachment = _decode_raw_message(sent_raw).get_payload()[1]
+        assert attachment.get_filename() == "report.pdf"
+        assert attachment.get_content_type() == "application/pdf"
+        assert attachment.get_payload(decode=True) == _PDF_CONTENT
+        # A single attachment is fetched directly rather than batched
+        service.new_batch_http_request.assert_not_called()
+
+    @pytest.mark.parametrize("batch_fails", [False, True], ids=["batch", "fallback"])
+    async def test_forward_with_multiple_attachments(self, batch_fails):
+        """Several attachments are downloaded in one batch, or sequentially if it fails."""
+        service = _make_mock_service()
+        service.get_message.return_value = _ORIGINAL_WITH_TEXT_FILES
+
+        def attachment_request(userId, messageId, id):
+            request = Mock()
+            request.execute.return_value = {"data": _TEXT_CONTENTS_B64[id]}
+            return request
+
+        service.users().messages().attachments().get.side_effect = attachment_request
+        if batch_fails:
+            service.new_batch_http_request.side_effect = RuntimeError("batch down")
+        service.send_message.return_value = {"id": "fwd_multi"}
+
+        result = await _forward_gmail_message_impl(
+            service=service,
+            user_google_email="me@example.com",
+            message_id="orig_msg_id",
+            to="recipient@example.com",
+        )
+        assert "fwd_multi" in result
+        service.new_batch_http_request.assert_called_once()
+
+        sent_raw = service.users().messages().send.call_args.kwargs["body"]["raw"]
+        parts = _decode_raw_message(sent_raw).get_payload()[1:]
+        assert [part.get_filename() for part in parts] == ["a.txt", "b.txt"]
+        assert [part.get_payload(decode=True) for part in parts] == list(
+            _TEXT_CONTENTS.values()
+        )
+
     async def test_forward_without_attachments(self):
         """include_attachments=False skips them."""
         service = _make_mock_service()
-        orig_msg = _make_original_message(
-            attachments=[
-                {
-                    "filename": "report.pdf",
-                    "mimeType": "application/pdf",
-                    "attachmentId": "att_id_1",
-                    "size": 1024,
-                }
-            ]
-        )
-        service.users().messages().get().execute.return_value = orig_msg
-        service.users().messages().send().execute.return_value = {"id": "fwd_noatt"}
+        service.get_message.return_value = _ORIGINAL_WITH_PDF
+        service.send_message.return_value = {"id": "fwd_noatt"}
 
         result = await _forward_gmail_message_impl(
             service=service,
@@ -150,17 +296,17 @@ class TestForwardGmailMessageImpl:
         # Attachment API should NOT have been called
         service.users().messages().attachments().get.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_forward_preserves_original_headers(self):
         """From, Date, To, Subject in quoted block."""
         service = _make_mock_service()
-        service.users().messages().get().execute.return_value = _make_original_message(
+        service.get_message.return_value = _cached_original_message(
             subject="Important Info",
             from_addr="boss@example.com",
             to_addr="me@example.com",
             date="Tue, 2 Jan 2024 09:00:00 +0000",
         )
-        service.users().messages().send().execute.return_value = {"id": "fwd_hdr"}
+        recorder = _SendRecorder({"id": "fwd_hdr"})
+        service.users().messages().send = recorder
 
         result = await _forward_gmail_message_impl(
             service=service,
@@ -171,23 +317,25 @@ class TestForwardGmailMessageImpl:
         )
         assert "fwd_hdr" in result
 
-    @pytest.mark.asyncio
+        sent = _decode_raw_message(recorder.calls[0]["body"]["raw"])
+        text = sent.get_payload(decode=True).decode()
+        assert text.startswith("Please review")
+        assert (
+            "From: boss@example.com\n"
+            "Date: Tue, 2 Jan 2024 09:00:00 +0000\n"
+            "Subject: Important Info\n"
+            "To: me@example.com\n"
+        ) in text
+
     async def test_forward_no_double_prefix(self):
         """'Fwd: X' doesn't become 'Fwd: Fwd: X'."""
         service = _make_mock_service()
-        service.users().messages().get().execute.return_value = _make_original_message(
+        service.get_message.return_value = _cached_original_message(
             subject="Fwd: Already forwarded"
         )
 
-        sent_bodies = []
-
-        def capture_send_call(**kwargs):
-            sent_bodies.append(kwargs.get("body", {}))
-            mock_result = Mock()
-            mock_result.execute.return_value = {"id": "fwd_nodouble"}
-            return mock_result
-
-        service.users().messages().send.side_effect = capture_send_call
+        recorder = _SendRecorder({"id": "fwd_nodouble"})
+        service.users().messages().send = recorder
 
         result = await _forward_gmail_message_impl(
             service=service,
@@ -198,41 +346,6 @@ class TestForwardGmailMessageImpl:
         assert "fwd_nodouble" in result
 
         # Verify subject in the raw MIME
-        if sent_bodies and "raw" in sent_bodies[0]:
-            msg = _decode_raw_message(sent_bodies[0]["raw"])
-            assert msg["Subject"] == "Fwd: Already forwarded"
-            assert not msg["Subject"].startswith("Fwd: Fwd:")
-
-    @pytest.mark.asyncio
-    async def test_forward_no_original_attachments(self):
-        """Forwarding a message with no attachments works cleanly."""
-        service = _make_mock_service()
-        service.users().messages().get().execute.return_value = _make_original_message()
-        service.users().messages().send().execute.return_value = {"id": "fwd_clean"}
-
-        result = await _forward_gmail_message_impl(
-            service=service,
-            user_google_email="me@example.com",
-            message_id="orig_msg_id",
-            to="recipient@example.com",
-            include_attachments=True,
-        )
-        assert "fwd_clean" in result
-
-    @pytest.mark.asyncio
-    async def test_forward_empty_body(self):
-        """Forwarding with no user body prepended."""
-        service = _make_mock_service()
-        service.users().messages().get().execute.return_value = _make_original_message(
-            body_text="Original content"
-        )
-        service.users().messages().send().execute.return_value = {"id": "fwd_nobody"}
-
-        result = await _forward_gmail_message_impl(
-            service=service,
-            user_google_email="me@example.com",
-            message_id="orig_msg_id",
-            to="recipient@example.com",
-            body="",
-        )
-        assert "fwd_nobody" in result
+        subject = _subject_of_raw(recorder.calls[0]["body"]["raw"])
+        assert subject == "Fwd: Already forwarded"
+        assert not subject.startswith("Fwd: Fwd:")
@@ -0,0 +1,143 @@
+"""
+Unit tests for resolving outgoing Gmail attachments.
+"""
+
+import base64
+import json
+import pytest
+
+import gmail.gmail_tools as gmail_tools
+from core.utils import UserInputError
+from gmail.gmail_tools import (
+    _ResolvedAttachment,
+    _parse_attachments_arg,
+    _prepare_gmail_message,
+    _resolve_attachments,
+)
+
+
+def _to_attachment(d: dict) -> _ResolvedAttachment:
+    """Helper to build a resolved attachment from a plain dict."""
+    return _ResolvedAttachment(
+        filename=d["filename"], mime_type=d["mime_type"], content=d["content"]
+    )
+
+
+_PDF = _to_attachment(
+    {"filename": "report.pdf", "mime_type": "application/pdf", "content": b"pdf bytes"}
+)
+_TXT = _to_attachment({"filename": "a.txt", "mime_type": "text/plain", "content": b"a"})
+
+
+def _inline(attachment: _ResolvedAttachment) -> dict:
+    """Helper to express a resolved attachment as inline base64 tool input."""
+    return {
+        "filename": attachment.filename,
+        "mime_type": attachment.mime_type,
+        "content": base64.b64encode(attachment.content).decode(),
+    }
+
+
+class TestResolveAttachments:
+    @pytest.mark.parametrize(
+        "items, expected",
+        [
+            ([_inline(_PDF)], [_PDF]),
+            ([_TXT], [_TXT]),
+            ([_inline(_PDF), _TXT], [_PDF, _TXT]),
+        ],
+        ids=["inline_base64", "already_resolved", "mixed_sources"],
+    )
+    def test_resolve_valid_sources(self, items, expected):
+        assert _resolve_attachments(items) == expected
+
+    def test_resolve_defaults_mime_type(self):
+        resolved = _resolve_attachments(
+            [{"filename": "blob", "content": base64.b64encode(b"x").decode()}]
+        )
+        assert resolved[0].mime_type == "application/octet-stream"
+
+    def test_resolve_skips_missing_filename(self):
+        content = base64.b64encode(b"x").decode()
+        assert _resolve_attachments([{"content": content}]) == []
+
+    def test_resolve_skips_missing_path_and_content(self):
+        assert _resolve_attachments([{"filename": "empty.txt"}]) == []
+
+    def test_resolve_rejects_invalid_base64(self):
+        with pytest.raises(UserInputError, match="bad.bin.*Invalid base64"):
+            _resolve_attachments([{"filename": "bad.bin", "content": "abc"}])
+
+    def test_resolve_accepts_wrapped_base64(self):
+        payload = bytes(range(256))
+        content = base64.encodebytes(payload).decode()
+        assert "\n" in content
+
+        resolved = _resolve_attachments([{"filename": "a.bin", "content": content}])
+        assert [a.content for a in resolved] == [payload]
+
+    def test_resolve_rejects_non_base64_characters(self):
+        """Url-safe or stray characters fail instead of being silently dropped."""
+        with pytest.raises(UserInputError, match="Invalid base64"):
+            _resolve_attachments([{"filename": "a.bin", "content": "ab-_"}])
+
+    def test_resolve_rejects_oversized_base64(self, monkeypatch):
+        """Oversized attachments fail the call instead of being dropped."""
+        monkeypatch.setattr(gmail_tools, "GMAIL_ATTACHMENT_SIZE_LIMIT", 6)
+        monkeypatch.setattr(gmail_tools, "_MAX_ATTACHMENT_BASE64_LEN", 8)
+        content = base64.b64encode(b"7 bytes").decode()
+
+        with pytest.raises(UserInputError, match="big.bin.*25MB"):
+            _resolve_attachments([{"filename": "big.bin", "content": content}])
+
+    def test_prepare_message_fails_on_oversized_attachment(self, monkeypatch):
+        monkeypatch.setattr(gmail_tools, "GMAIL_ATTACHMENT_SIZE_LIMIT", 6)
+        monkeypatch.setattr(gmail_tools, "_MAX_ATTACHMENT_BASE64_LEN", 8)
+        content = base64.b64encode(b"7 bytes").decode()
+
+        with pytest.raises(UserInputError, match="25MB"):
+            _prepare_gmail_message(
+                subject="Report",
+                body="See attached.",
+                attachments=[{"filename": "big.bin", "content": content}],
+            )
+
+    def test_resolve_accepts_attachment_at_limit(self, monkeypatch):
+        monkeypatch.setattr(gmail_tools, "GMAIL_ATTACHMENT_SIZE_LIMIT", 6)
+        monkeypatch.setattr(gmail_tools, "_MAX_ATTACHMENT_BASE64_LEN", 8)
+        content = base64.b64encode(b"6bytes").decode()
+
+        resolved = _resolve_attachments([{"filename": "ok.bin", "content": content}])
+        assert [a.content for a in resolved] == [b"6bytes"]
+
+    def test_resolve_accepts_wrapped_base64_at_limit(self, monkeypatch):
+        """Line breaks don't count towards the encoded length limit."""
+        monkeypatch.setattr(gmail_tools, "GMAIL_ATTACHMENT_SIZE_LIMIT", 60)
+        monkeypatch.setattr(gmail_tools, "_MAX_ATTACHMENT_BASE64_LEN", 80)
+        payload = bytes(range(60))
+        content = base64.encodebytes(payload).decode()
+        assert len(content) > 80
+
+        resolved = _resolve_attachments([{"filename": "ok.bin", "content": content}])
+        assert [a.content for a in resolved] == [payload]
+
+
+class TestParseAttachmentsArg:
+    def test_list_passes_through(self):
+        attachments = [{"path": "/tmp/report.pdf"}]
+        assert _parse_attachments_arg(attachments) is attachments
+
+    def test_none_passes_through(self):
+        assert _parse_attachments_arg(None) is None
+
+    def test_json_string_is_parsed(self):
+        attachments = [{"filename": "a.txt", "content": "YQ=="}]
+        assert _parse_attachments_arg(json.dumps(attachments)) == attachments
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(UserInputError, match="Invalid JSON"):
+            _parse_attachments_arg("[{not json")
+
+    def test_non_list_json_raises(self):
+        with pytest.raises(UserInputError, match="list of objects"):
+            _parse_attachments_arg('{"filename": "a.txt"}')
@@ -7,10 +7,6 @@ vertical_alignment, bold, italic, and font_size.
 
 import pytest
 from unittest.mock import Mock
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from gsheets.sheets_tools import _format_sheet_range_impl
 
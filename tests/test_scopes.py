@@ -6,11 +6,6 @@ they need for operations like search_docs, list_docs_in_folder,
 export_doc_to_pdf, and list_spreadsheets — without requiring --tools drive.
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from auth.scopes import (
     CALENDAR_READONLY_SCOPE,
     CALENDAR_SCOPE,
@@ -27,8 +22,12 @@ from auth.scopes import (
     GMAIL_SETTINGS_BASIC_SCOPE,
     SHEETS_READONLY_SCOPE,
     SHEETS_WRITE_SCOPE,
+    get_current_scopes,
+    get_scope_checker,
     get_scopes_for_tools,
     has_required_scopes,
+    intern_scopes,
+    set_enabled_tools,
     set_read_only,
 )
 
@@ -108,6 +107,51 @@ class TestReadOnlyScopes:
         assert DRIVE_READONLY_SCOPE in scopes
 
 
+class TestCurrentScopes:
+    """Tests for cached scope resolution of the configured tools."""
+
+    def teardown_method(self):
+        set_enabled_tools(None)
+        set_read_only(False)
+
+    def test_matches_scopes_for_enabled_tools(self):
+        set_enabled_tools(["gmail", "docs"])
+        assert set(get_current_scopes()) == set(get_scopes_for_tools(["gmail", "docs"]))
+
+    def test_read_only_toggle_invalidates_cache(self):
+        """Switching read-only mode after a lookup must not return stale scopes."""
+        set_enabled_tools(["gmail"])
+        assert GMAIL_SEND_SCOPE in get_current_scopes()
+        set_read_only(True)
+        assert GMAIL_SEND_SCOPE not in get_current_scopes()
+        assert GMAIL_READONLY_SCOPE in get_current_scopes()
+
+    def test_enabled_tools_change_invalidates_cache(self):
+        set_enabled_tools(["gmail"])
+        assert SHEETS_WRITE_SCOPE not in get_current_scopes()
+        set_enabled_tools(["sheets"])
+        assert SHEETS_WRITE_SCOPE in get_current_scopes()
+
+
+class TestScopeChecker:
+    """Tests for the read-only scope membership checker."""
+
+    def teardown_method(self):
+        set_read_only(False)
+
+    def test_none_when_not_read_only(self):
+        set_read_only(False)
+        assert get_scope_checker() is None
+
+    def test_checks_read_only_scopes(self):
+        set_read_only(True)
+        is_allowed = get_scope_checker()
+        assert is_allowed(GMAIL_READONLY_SCOPE)
+        assert is_allowed(DRIVE_READONLY_SCOPE)
+        assert not is_allowed(GMAIL_SEND_SCOPE)
+        assert not is_allowed(DRIVE_SCOPE)
+
+
 class TestHasRequiredScopes:
     """Tests for hierarchy-aware scope checking."""
 
@@ -195,3 +239,25 @@ class TestHasRequiredScopes:
         available = [GMAIL_MODIFY_SCOPE]
         required = [GMAIL_READONLY_SCOPE, DRIVE_READONLY_SCOPE]
         assert not has_required_scopes(available, required)
+
+
+class TestInternScopes:
+    """Tests for canonicalizing externally supplied scope strings."""
+
+    def test_known_scopes_map_to_constants(self):
+        # Build equal strings at runtime so they are distinct objects
+        loaded = ["".join(list(GMAIL_READONLY_SCOPE)), "".join(list(DRIVE_SCOPE))]
+        assert loaded[1] is not DRIVE_SCOPE
+        interned = intern_scopes(loaded)
+        assert interned[0] is GMAIL_READONLY_SCOPE
+        assert interned[1] is DRIVE_SCOPE
+
+    def test_unknown_scopes_are_shared(self):
+        custom = "https://www.googleapis.com/auth/example.custom"
+        first = intern_scopes(["".join(list(custom))])[0]
+        second = intern_scopes(["".join(list(custom))])[0]
+        assert first == custom
+        assert first is second
+
+    def test_none_passes_through(self):
+        assert intern_scopes(None) is None